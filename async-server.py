@@ -26,6 +26,62 @@ class SyncParserServer:
                 if port > 8899:
                     raise Exception("Не удалось найти свободный порт")
     
+    def parse_price(self, price_text):
+        """Нормализация цены из текста карточки"""
+        numbers = re.findall(r'[\d\s]+', price_text)
+        if numbers:
+            price_text = numbers[0].replace(' ', '').replace(',', '.')
+            try:
+                return float(price_text)
+            except:
+                return 0
+        return 0
+    
+    def extract_products(self, html, page_num):
+        """Извлечение товаров из HTML страницы каталога"""
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        items = soup.select(".set-card.block")
+        if not items:
+            items = soup.select(".product-card")
+        if not items:
+            items = soup.select(".catalog-item")
+        if not items:
+            items = soup.find_all("div", class_=lambda x: x and any(word in str(x) for word in ['product', 'item', 'card']))
+        
+        page_products = []
+        
+        for card in items:
+            try:
+                name = "NONAME"
+                name_selectors = ["a.di_b.c_b", ".product-name", ".title", "h3", "h4"]
+                
+                for selector in name_selectors:
+                    name_tag = card.select_one(selector)
+                    if name_tag and name_tag.text.strip():
+                        name = name_tag.text.strip()
+                        break
+                
+                price = 0
+                price_selectors = [".set-card__price", ".price", ".product-price", ".cost"]
+                
+                for selector in price_selectors:
+                    price_tag = card.select_one(selector)
+                    if price_tag and price_tag.text.strip():
+                        price = self.parse_price(price_tag.text.strip())
+                        break
+                
+                page_products.append({
+                    'name': name[:100],
+                    'price': price,
+                    'page': page_num
+                })
+                
+            except Exception:
+                continue
+        
+        return page_products
+    
     def parse_page(self, page_num):
         """Парсинг одной страницы"""
         try:
@@ -42,55 +98,8 @@ class SyncParserServer:
             response = requests.get(url, headers=headers, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            items = soup.select(".set-card.block")
-            if not items:
-                items = soup.select(".product-card")
-            if not items:
-                items = soup.select(".catalog-item")
-            if not items:
-                items = soup.find_all("div", class_=lambda x: x and any(word in str(x) for word in ['product', 'item', 'card']))
-            
-            print(f"  На странице {page_num} найдено элементов: {len(items)}")
-            
-            page_products = []
-            
-            for card in items:
-                try:
-                    name = "NONAME"
-                    name_selectors = ["a.di_b.c_b", ".product-name", ".title", "h3", "h4"]
-                    
-                    for selector in name_selectors:
-                        name_tag = card.select_one(selector)
-                        if name_tag and name_tag.text.strip():
-                            name = name_tag.text.strip()
-                            break
-                    
-                    price = 0
-                    price_selectors = [".set-card__price", ".price", ".product-price", ".cost"]
-                    
-                    for selector in price_selectors:
-                        price_tag = card.select_one(selector)
-                        if price_tag and price_tag.text.strip():
-                            price_text = price_tag.text.strip()
-                            numbers = re.findall(r'[\d\s]+', price_text)
-                            if numbers:
-                                price_text = numbers[0].replace(' ', '').replace(',', '.')
-                                try:
-                                    price = float(price_text)
-                                except:
-                                    price = 0
-                            break
-                    
-                    page_products.append({
-                        'name': name[:100],
-                        'price': price,
-                        'page': page_num
-                    })
-                    
-                except Exception:
-                    continue
+            page_products = self.extract_products(response.text, page_num)
+            print(f"  На странице {page_num} найдено элементов: {len(page_products)}")
             
             return page_products
             
@@ -98,6 +107,24 @@ class SyncParserServer:
             print(f"Ошибка парсинга страницы {page_num}: {e}")
             return []
     
+    def aggregate_results(self, results):
+        """Объединение результатов страниц и удаление дубликатов по названию"""
+        all_products = []
+        total_price = 0
+        
+        for page_products in results.values():
+            all_products.extend(page_products)
+            total_price += sum(p['price'] for p in page_products)
+        
+        unique_products = []
+        seen_names = set()
+        for product in all_products:
+            if product['name'] not in seen_names:
+                seen_names.add(product['name'])
+                unique_products.append(product)
+        
+        return unique_products, total_price
+    
     def parse_pages_threaded(self, pages):
         """Многопоточный парсинг страниц"""
         start_time = time.time()
@@ -116,19 +143,7 @@ class SyncParserServer:
         for thread in threads:
             thread.join()
         
-        all_products = []
-        total_price = 0
-        
-        for page_products in results.values():
-            all_products.extend(page_products)
-            total_price += sum(p['price'] for p in page_products)
-        
-        unique_products = []
-        seen_names = set()
-        for product in all_products:
-            if product['name'] not in seen_names:
-                seen_names.add(product['name'])
-                unique_products.append(product)
+        unique_products, total_price = self.aggregate_results(results)
         
         execution_time = time.time() - start_time
         
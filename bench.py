@@ -0,0 +1,291 @@
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_DIR = os.path.join(BASE_DIR, 'bench_fixtures')
+BASELINE_FILE = os.path.join(BASE_DIR, 'bench_baseline.json')
+DEFAULT_THRESHOLD = 0.3
+
+def load_server_module(filename, module_name):
+    """Загружает модуль сервера по имени файла (имена файлов содержат дефис)"""
+    path = os.path.join(BASE_DIR, filename)
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def load_fixtures():
+    """Читает сохраненные HTML страницы каталога"""
+    fixtures = {}
+    for filename in sorted(os.listdir(FIXTURES_DIR)):
+        if filename.startswith('catalog_page_') and filename.endswith('.html'):
+            page_num = int(filename[len('catalog_page_'):-len('.html')])
+            with open(os.path.join(FIXTURES_DIR, filename), 'r', encoding='utf-8') as f:
+                fixtures[page_num] = f.read()
+    return fixtures
+
+def measure(func, rounds, min_time=0.2):
+    """Возвращает лучшее время (в секундах) одного вызова func
+
+    Количество вызовов в раунде подбирается так, чтобы раунд длился
+    не меньше min_time, иначе короткие замеры тонут в шуме.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - start >= min_time:
+            break
+        number *= 2
+
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best / number
+
+def bench_parse_page(server, fixtures, rounds):
+    """Пропускная способность извлечения товаров из HTML"""
+    cards = sum(len(server.extract_products(html, page)) for page, html in fixtures.items())
+
+    def run():
+        for page, html in fixtures.items():
+            server.extract_products(html, page)
+
+    elapsed = measure(run, rounds)
+    return {
+        'pages/s': len(fixtures) / elapsed,
+        'cards/s': cards / elapsed
+    }
+
+def bench_parse_price(server, price_texts, rounds):
+    """Скорость нормализации цен"""
+    def run():
+        for text in price_texts:
+            server.parse_price(text)
+
+    elapsed = measure(run, rounds)
+    return {'prices/s': len(price_texts) / elapsed}
+
+def bench_aggregate(server, results, rounds):
+    """Скорость объединения результатов страниц (и удаления дубликатов)"""
+    products = sum(len(p) for p in results.values())
+    elapsed = measure(lambda: server.aggregate_results(results), rounds)
+    return {
+        'aggregations/s': 1 / elapsed,
+        'products/s': products / elapsed
+    }
+
+def bench_json(result, rounds):
+    """Скорость сериализации ответа сервера в JSON"""
+    elapsed = measure(lambda: json.dumps(result, ensure_ascii=False, indent=2).encode(), rounds)
+    return {'responses/s': 1 / elapsed}
+
+def bench_socket(server, pages, rounds):
+    """Время запроса-ответа через сокет на loopback"""
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind(('127.0.0.1', 0))
+    listener.listen(5)
+    port = listener.getsockname()[1]
+
+    def accept_loop():
+        while True:
+            try:
+                client_socket, _ = listener.accept()
+            except OSError:
+                break
+            threading.Thread(target=server.handle_client, args=(client_socket,)).start()
+
+    threading.Thread(target=accept_loop, daemon=True).start()
+
+    request = json.dumps({'pages': pages, 'max_products': 20}).encode()
+
+    def run():
+        client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        client.settimeout(10)
+        client.connect(('127.0.0.1', port))
+        client.send(request)
+        response_data = b""
+        while True:
+            chunk = client.recv(4096)
+            if not chunk:
+                break
+            response_data += chunk
+        client.close()
+        if 'error' in json.loads(response_data.decode()):
+            raise RuntimeError(f"Сервер вернул ошибку: {response_data[:200]!r}")
+
+    try:
+        elapsed = measure(run, rounds)
+    finally:
+        listener.close()
+    return {'requests/s': 1 / elapsed}
+
+def build_benchmarks(rounds):
+    """Готовит данные и возвращает словарь: имя бенчмарка -> функция замера"""
+    async_module = load_server_module('async-server.py', 'async_server')
+    sync_module = load_server_module('sync-server.py', 'sync_server')
+    fixtures = load_fixtures()
+    if not fixtures:
+        raise RuntimeError(f"Не найдены HTML фикстуры в {FIXTURES_DIR}")
+
+    async_server = async_module.SyncParserServer()
+    sync_server = sync_module.MultithreadedParserServer()
+
+    async_pages = {page: async_server.extract_products(html, page) for page, html in fixtures.items()}
+    sync_pages = {page: sync_server.extract_products(html, page) for page, html in fixtures.items()}
+
+    price_texts = []
+    for html in fixtures.values():
+        start = 0
+        marker = '<div class="set-card__price">'
+        while True:
+            start = html.find(marker, start)
+            if start == -1:
+                break
+            start += len(marker)
+            price_texts.append(html[start:html.index('</div>', start)].strip())
+
+    # Сервер для сокетного теста отдает заранее разобранные страницы,
+    # чтобы измерялся только путь запрос -> агрегация -> JSON -> ответ
+    class FixtureParserServer(async_module.SyncParserServer):
+        def parse_page(self, page_num):
+            return async_pages.get(page_num, [])
+
+    unique_products, total_price = async_server.aggregate_results(async_pages)
+    response = {
+        'products_count': len(unique_products),
+        'total_price': total_price,
+        'execution_time': 0.0,
+        'products': unique_products[:20]
+    }
+
+    return {
+        'parse_page.async_server': lambda: bench_parse_page(async_server, fixtures, rounds),
+        'parse_page.sync_server': lambda: bench_parse_page(sync_server, fixtures, rounds),
+        'parse_price.async_server': lambda: bench_parse_price(async_server, price_texts, rounds),
+        'parse_price.sync_server': lambda: bench_parse_price(sync_server, price_texts, rounds),
+        'aggregate_results.async_server': lambda: bench_aggregate(async_server, async_pages, rounds),
+        'aggregate_results.sync_server': lambda: bench_aggregate(sync_server, sync_pages, rounds),
+        'json_dumps.response': lambda: bench_json(response, rounds),
+        'socket.round_trip': lambda: bench_socket(FixtureParserServer(), sorted(fixtures), rounds)
+    }
+
+def find_regressions(results, baseline, threshold):
+    """Возвращает имена бенчмарков, у которых метрика упала ниже порога"""
+    regressed = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            base_value = baseline.get(name, {}).get(metric)
+            if base_value and value / base_value - 1 < -threshold:
+                regressed.append(name)
+                break
+    return regressed
+
+def compare_with_baseline(results, baseline, threshold):
+    """Сравнивает результаты с базовой линией, возвращает список регрессий"""
+    regressions = []
+
+    print(f"{'Бенчмарк':40} {'Метрика':16} {'Базовая':>12} {'Текущая':>12} {'Изм.':>8}")
+    print("-"*92)
+
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            base_value = baseline.get(name, {}).get(metric)
+            if not base_value:
+                print(f"{name:40} {metric:16} {'-':>12} {value:12.1f} {'new':>8}")
+                continue
+
+            change = value / base_value - 1
+            mark = ""
+            if change < -threshold:
+                mark = " ✗"
+                regressions.append((name, metric, base_value, value, change))
+            print(f"{name:40} {metric:16} {base_value:12.1f} {value:12.1f} {change:+8.1%}{mark}")
+
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Микробенчмарки парсера на сохраненных HTML страницах")
+    parser.add_argument('--rounds', type=int, default=5, help="количество повторов каждого замера (берется лучший)")
+    parser.add_argument('--threshold', type=float, default=None,
+                        help=f"допустимое падение производительности (по умолчанию из базовой линии или {DEFAULT_THRESHOLD})")
+    parser.add_argument('--retries', type=int, default=2, help="сколько раз перемерять бенчмарк, не прошедший порог (и число дополнительных прогонов для базовой линии)")
+    parser.add_argument('--update-baseline', action='store_true', help="сохранить результаты как новую базовую линию")
+    args = parser.parse_args()
+
+    print("="*60)
+    print("МИКРОБЕНЧМАРКИ ПАРСЕРА")
+    print("="*60)
+
+    baseline = {}
+    threshold = DEFAULT_THRESHOLD
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        baseline = data.get('results', {})
+        threshold = data.get('threshold', DEFAULT_THRESHOLD)
+    if args.threshold is not None:
+        threshold = args.threshold
+
+    # Серверы печатают ход работы, во время замеров это только мешает
+    with contextlib.redirect_stdout(io.StringIO()):
+        benchmarks = build_benchmarks(args.rounds)
+        results = {name: bench() for name, bench in benchmarks.items()}
+
+        # Базовая линия - медиана нескольких прогонов, а не случайно быстрый замер
+        if args.update_baseline:
+            runs = [results] + [{name: bench() for name, bench in benchmarks.items()}
+                                for _ in range(args.retries)]
+            results = {name: {metric: statistics.median(run[name][metric] for run in runs)
+                              for metric in metrics}
+                       for name, metrics in results.items()}
+        else:
+            # Одиночный провал может быть шумом машины: перемеряем и берем лучший результат
+            for _ in range(args.retries):
+                regressed = find_regressions(results, baseline, threshold)
+                if not regressed:
+                    break
+                for name in regressed:
+                    retry = benchmarks[name]()
+                    for metric, value in retry.items():
+                        results[name][metric] = max(results[name][metric], value)
+
+    regressions = compare_with_baseline(results, baseline, threshold)
+
+    if args.update_baseline:
+        with open(BASELINE_FILE, 'w', encoding='utf-8') as f:
+            rounded = {name: {metric: round(value, 1) for metric, value in metrics.items()}
+                       for name, metrics in results.items()}
+            json.dump({'threshold': threshold, 'results': rounded}, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"\n✓ Базовая линия сохранена в '{os.path.basename(BASELINE_FILE)}'")
+        return 0
+
+    print("\n" + "="*60)
+    if regressions:
+        print(f"✗ Регрессии производительности (порог {threshold:.0%}):")
+        for name, metric, base_value, value, change in regressions:
+            print(f"  {name} [{metric}]: {base_value:.1f} -> {value:.1f} ({change:+.1%})")
+        return 1
+
+    print(f"✓ Регрессий нет (порог {threshold:.0%})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
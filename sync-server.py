@@ -10,6 +10,42 @@ class MultithreadedParserServer:
         self.base_url = "https://dental-first.ru/catalog"
         self.lock = threading.Lock()
     
+    def parse_price(self, price_text):
+        """Нормализация цены из текста карточки"""
+        price_text = price_text.replace(" ", "").replace("₽", "").replace(",", ".")
+        try:
+            return float(price_text)
+        except:
+            return 0
+    
+    def extract_products(self, html, page_num):
+        """Извлечение товаров из HTML страницы каталога"""
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        # Ищем карточки товаров
+        items = soup.select(".set-card.block")
+        page_products = []
+        
+        for card in items:
+            # Название товара
+            name_tag = card.select_one("a.di_b.c_b")
+            name = name_tag.get_text(strip=True) if name_tag else "NONAME"
+            
+            # Цена товара
+            price_tag = card.select_one(".set-card__price")
+            if price_tag:
+                price = self.parse_price(price_tag.get_text(strip=True))
+            else:
+                price = 0
+            
+            page_products.append({
+                'name': name,
+                'price': price,
+                'page': page_num
+            })
+        
+        return page_products
+    
     def parse_page(self, page_num):
         """Парсинг одной страницы (синхронно)"""
         try:
@@ -20,34 +56,7 @@ class MultithreadedParserServer:
             
             # Загружаем страницу
             response = requests.get(url, timeout=10)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Ищем карточки товаров
-            items = soup.select(".set-card.block")
-            page_products = []
-            
-            for card in items:
-                # Название товара
-                name_tag = card.select_one("a.di_b.c_b")
-                name = name_tag.get_text(strip=True) if name_tag else "NONAME"
-                
-                # Цена товара
-                price_tag = card.select_one(".set-card__price")
-                if price_tag:
-                    price_text = price_tag.get_text(strip=True)
-                    price_text = price_text.replace(" ", "").replace("₽", "").replace(",", ".")
-                    try:
-                        price = float(price_text)
-                    except:
-                        price = 0
-                else:
-                    price = 0
-                
-                page_products.append({
-                    'name': name,
-                    'price': price,
-                    'page': page_num
-                })
+            page_products = self.extract_products(response.text, page_num)
             
             return page_products
             
@@ -55,11 +64,20 @@ class MultithreadedParserServer:
             print(f"Error parsing page {page_num}: {e}")
             return []
     
+    def aggregate_results(self, results):
+        """Объединение результатов страниц и подсчет суммарной стоимости"""
+        all_products = []
+        total_price = 0
+        
+        for page_products in results.values():
+            all_products.extend(page_products)
+            total_price += sum(p['price'] for p in page_products)
+        
+        return all_products, total_price
+    
     def parse_pages_threaded(self, pages):
         """Многопоточный парсинг страниц"""
         start_time = time.time()
-        all_products = []
-        total_price = 0
         
         # Создаем потоки для каждой страницы
         threads = []
@@ -78,9 +96,7 @@ class MultithreadedParserServer:
             thread.join()
         
         # Собираем результаты
-        for page_products in results.values():
-            all_products.extend(page_products)
-            total_price += sum(p['price'] for p in page_products)
+        all_products, total_price = self.aggregate_results(results)
         
         execution_time = time.time() - start_time
         